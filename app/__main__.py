@@ -147,6 +147,11 @@ def main():
 
     # 获取uvicorn配置
     uvicorn_config = DEV_CONFIG.get_uvicorn_config(settings.DEBUG)
+    if uvicorn_config.get("workers", 1) > 1:
+        logger.warning(
+            f"⚠️ 多进程模式: {uvicorn_config['workers']} 个工作进程，"
+            f"定时任务与进程内缓存将在每个进程中独立运行"
+        )
 
     # 设置简化的日志配置
     logger.info("🔧 正在设置日志配置...")
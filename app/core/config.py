@@ -91,6 +91,13 @@ class Settings(BaseSettings):
     DEFAULT_USER_CONCURRENT_LIMIT: int = Field(default=3)
     GLOBAL_CONCURRENT_LIMIT: int = Field(default=50)
     DEFAULT_DAILY_QUOTA: int = Field(default=1000)
+    # 单进程内同时执行的分析任务上限（超出部分在事件循环上排队）
+    TRADINGAGENTS_API_MAX_CONCURRENCY: int = Field(default=3, ge=1)
+    # 事件循环默认线程池大小（asyncio.to_thread 等共用，数据同步任务也会占用）
+    TRADINGAGENTS_THREAD_POOL_SIZE: int = Field(default=16, ge=1)
+    # LLM 供应商熔断：连续失败次数阈值（0 表示关闭），熔断后冷却秒数
+    TRADINGAGENTS_LLM_BREAKER_THRESHOLD: int = Field(default=3, ge=0)
+    TRADINGAGENTS_LLM_BREAKER_COOLDOWN: int = Field(default=60, ge=1)
 
     # 速率限制
     RATE_LIMIT_ENABLED: bool = Field(default=True)
@@ -101,6 +108,20 @@ class Settings(BaseSettings):
     LOG_FORMAT: str = Field(default="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
     LOG_FILE: str = Field(default="logs/tradingagents.log")
 
+    # Uvicorn 服务器配置
+    # 事件循环实现：uvloop/asyncio/auto（Windows 或未安装 uvloop 时自动回退为 auto）
+    TRADINGAGENTS_API_LOOP: str = Field(default="uvloop")
+    # 工作进程数：>1 时多进程并行处理请求（定时任务、内存缓存与任务状态均为进程内，详见 .env.example）
+    TRADINGAGENTS_API_WORKERS: int = Field(default=1, ge=1)
+    # 监听队列长度（突发连接排队，避免被内核直接拒绝）
+    TRADINGAGENTS_API_BACKLOG: int = Field(default=2048, ge=1)
+    # HTTP keep-alive 空闲超时（秒），前端轮询可复用连接
+    TRADINGAGENTS_API_KEEPALIVE: int = Field(default=30, ge=1)
+    # 单进程最大并发连接数，超出返回 503（0 表示不限制）
+    TRADINGAGENTS_API_LIMIT: int = Field(default=256, ge=0)
+    # 工作进程处理请求数上限，达到后由主进程重启以回收内存（仅多进程模式生效，0 表示不限制）
+    TRADINGAGENTS_API_MAX_REQUESTS: int = Field(default=10000, ge=0)
+
     # 代理配置
     # 用于配置需要绕过代理的域名（国内数据源）
     # 多个域名用逗号分隔
@@ -119,6 +140,8 @@ class Settings(BaseSettings):
     # 缓存配置
     CACHE_TTL: int = Field(default=3600)  # 1小时
     SCREENING_CACHE_TTL: int = Field(default=1800)  # 30分钟
+    # 相同参数分析结果的复用时长（秒，进程内缓存，0 表示禁用）
+    TRADINGAGENTS_CACHE_TTL: int = Field(default=900, ge=0)  # 15分钟
 
     # 安全配置
     BCRYPT_ROUNDS: int = Field(default=12)
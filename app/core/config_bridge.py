@@ -283,10 +283,12 @@ def bridge_config_to_env():
             # 不在异步上下文中，使用 asyncio.run
             asyncio.run(_sync_pricing_config_from_db())
 
+        _invalidate_env_api_key_cache()
         logger.info(f"✅ 配置桥接完成，共桥接 {bridged_count} 项配置")
         return True
 
     except Exception as e:
+        _invalidate_env_api_key_cache()
         logger.error(f"❌ 配置桥接失败: {e}", exc_info=True)
         logger.warning("⚠️  TradingAgents 将使用 .env 文件中的配置")
         return False
@@ -491,6 +493,18 @@ def _bridge_system_settings() -> int:
         return 0
 
 
+def _invalidate_env_api_key_cache():
+    """
+    清除分析服务中按供应商缓存的环境变量 API Key
+
+    分析服务模块尚未加载时无需处理，避免在此处引入其重量级依赖
+    """
+    import sys
+    module = sys.modules.get("app.services.simple_analysis_service")
+    if module is not None:
+        module._get_env_api_key_for_provider.cache_clear()
+
+
 def get_bridged_api_key(provider: str) -> Optional[str]:
     """
     获取桥接的 API 密钥
@@ -574,6 +588,7 @@ def clear_bridged_config():
             del os.environ[key]
             logger.debug(f"  清除环境变量: {key}")
 
+    _invalidate_env_api_key_cache()
     logger.info("✅ 已清除所有桥接的配置")
 
 
@@ -3,7 +3,9 @@
 优化开发体验，减少不必要的文件监控
 """
 
+import importlib.util
 import logging
+import sys
 from typing import List, Optional
 
 
@@ -96,14 +98,44 @@ class DevConfig:
     # 是否显示访问日志
     ACCESS_LOG: bool = True
     
+    @staticmethod
+    def _resolve_loop(loop: str) -> str:
+        """解析事件循环实现，uvloop 不可用时（如 Windows）回退到 auto"""
+        loop = (loop or "auto").lower()
+        if loop == "uvloop" and (sys.platform == "win32" or importlib.util.find_spec("uvloop") is None):
+            return "auto"
+        return loop
+
+    @staticmethod
+    def _resolve_http() -> str:
+        """优先使用 httptools 解析 HTTP，未安装时回退到 auto（h11）"""
+        return "httptools" if importlib.util.find_spec("httptools") is not None else "auto"
+
     @classmethod
     def get_uvicorn_config(cls, debug: bool = True) -> dict:
         """获取uvicorn配置"""
+        from app.core.config import settings
+
+        # 日志级别为 WARNING 及以上时关闭访问日志，避免每个请求都写一次日志
+        app_log_level = logging.getLevelName(str(settings.LOG_LEVEL).upper())
+        access_log = cls.ACCESS_LOG and not (isinstance(app_log_level, int) and app_log_level >= logging.WARNING)
+
+        workers = settings.TRADINGAGENTS_API_WORKERS
+        # 单进程模式下达到请求上限会直接退出（无主进程负责重启），因此仅多进程时启用
+        max_requests = settings.TRADINGAGENTS_API_MAX_REQUESTS if workers > 1 else 0
+
         # 统一禁用reload，避免日志配置冲突
         return {
-            "reload": False,  # 禁用自动重载，手动重启
+            "reload": False,  # 禁用自动重载，手动重启（多进程模式下也不可启用）
+            "workers": workers,
+            "loop": cls._resolve_loop(settings.TRADINGAGENTS_API_LOOP),
+            "http": cls._resolve_http(),
+            "backlog": settings.TRADINGAGENTS_API_BACKLOG,
+            "timeout_keep_alive": settings.TRADINGAGENTS_API_KEEPALIVE,
+            "limit_concurrency": settings.TRADINGAGENTS_API_LIMIT or None,
+            "limit_max_requests": max_requests or None,
             "log_level": cls.LOG_LEVEL,
-            "access_log": cls.ACCESS_LOG,
+            "access_log": access_log,
             # 确保使用我们自定义的日志配置
             "log_config": None  # 禁用uvicorn默认日志配置，使用我们的配置
         }
@@ -0,0 +1,52 @@
+"""
+共享 HTTP 客户端管理
+在应用生命周期内复用同一个 httpx.AsyncClient，避免每次请求重新建立连接与 TLS 握手
+"""
+
+import logging
+from typing import Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# 全局HTTP客户端
+http_client: Optional[httpx.AsyncClient] = None
+
+
+def _create_http_client() -> httpx.AsyncClient:
+    """创建带连接池的异步HTTP客户端"""
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(60.0, connect=10.0),
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+    )
+
+
+async def init_http_client() -> httpx.AsyncClient:
+    """初始化共享HTTP客户端"""
+    global http_client
+    if http_client is None or http_client.is_closed:
+        http_client = _create_http_client()
+        logger.info("✅ 共享HTTP客户端初始化成功")
+    return http_client
+
+
+async def close_http_client():
+    """关闭共享HTTP客户端"""
+    global http_client
+    if http_client is not None:
+        try:
+            await http_client.aclose()
+            logger.info("✅ 共享HTTP客户端已关闭")
+        except Exception as e:
+            logger.warning(f"关闭共享HTTP客户端失败: {e}")
+        finally:
+            http_client = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """获取共享HTTP客户端（未经 lifespan 初始化时按需创建）"""
+    global http_client
+    if http_client is None or http_client.is_closed:
+        http_client = _create_http_client()
+    return http_client
@@ -1,5 +1,7 @@
 import logging
 import logging.config
+import logging.handlers
+import queue
 import sys
 from pathlib import Path
 import os
@@ -63,12 +65,64 @@ def _parse_size(size_str: str) -> int:
             return 10 * 1024 * 1024
     return 10 * 1024 * 1024
 
+# 队列日志：(logger, 原处理器列表) 及后台监听器
+_queued_loggers: list = []
+_queue_listeners: list = []
+
+
+def start_queue_logging():
+    """将已配置的日志处理器移到后台线程执行
+    每个 logger 的处理器替换为 QueueHandler，业务代码记录日志时只做一次入队，
+    文件/控制台写入由 QueueListener 线程完成。处理器组合相同的 logger 共用一个队列。
+    """
+    stop_queue_logging()
+
+    loggers = [logging.getLogger()]
+    for logger_obj in list(logging.Logger.manager.loggerDict.values()):
+        if isinstance(logger_obj, logging.Logger):
+            loggers.append(logger_obj)
+
+    queue_handlers = {}
+    for logger_obj in loggers:
+        handlers = tuple(logger_obj.handlers)
+        if not handlers or any(isinstance(h, logging.handlers.QueueHandler) for h in handlers):
+            continue
+        queue_handler = queue_handlers.get(handlers)
+        if queue_handler is None:
+            log_queue = queue.Queue(-1)
+            queue_handler = logging.handlers.QueueHandler(log_queue)
+            # trace_id 存于 contextvars，必须在记录日志的线程中注入
+            queue_handler.addFilter(LoggingContextFilter())
+            listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+            listener.start()
+            _queue_listeners.append(listener)
+            queue_handlers[handlers] = queue_handler
+        _queued_loggers.append((logger_obj, list(handlers)))
+        logger_obj.handlers = [queue_handler]
+
+
+def stop_queue_logging():
+    """停止后台日志线程（会先写完队列中剩余的日志），并恢复原处理器"""
+    for listener in _queue_listeners:
+        try:
+            listener.stop()
+        except Exception:
+            pass
+    _queue_listeners.clear()
+    for logger_obj, handlers in _queued_loggers:
+        logger_obj.handlers = handlers
+    _queued_loggers.clear()
+
+
 def setup_logging(log_level: str = "INFO"):
     """
     设置应用日志配置：
     1) 优先尝试从 config/logging.toml 读取并转化为 dictConfig
     2) 失败或不存在时，回退到内置默认配置
     """
+    # 重新配置前先恢复同步处理器，避免 dictConfig 关闭仍被监听线程使用的处理器
+    stop_queue_logging()
+
     # 1) 若存在 TOML 配置且可解析，则优先使用
     try:
         cfg_path = resolve_logging_cfg_path()
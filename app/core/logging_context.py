@@ -8,9 +8,13 @@ trace_id_var: contextvars.ContextVar[str] = contextvars.ContextVar("trace_id", d
 class LoggingContextFilter(logging.Filter):
     """Injects trace_id from contextvars into LogRecord.
     Always sets record.trace_id to a string (default '-') so formatters are safe.
+    A trace_id already set on the record (e.g. by a QueueHandler in the emitting
+    thread) is kept, since the contextvar is not visible from the listener thread.
     """
 
     def filter(self, record: logging.LogRecord) -> bool:
+        if getattr(record, "trace_id", None) is not None:
+            return True
         try:
             record.trace_id = trace_id_var.get()
         except Exception:
@@ -4,6 +4,7 @@ Redis客户端配置和连接管理
 
 import redis.asyncio as redis
 import logging
+import secrets
 from typing import Optional
 from .config import settings
 
@@ -171,8 +172,7 @@ class RedisService:
     
     async def acquire_lock(self, lock_key: str, timeout: int = 30):
         """获取分布式锁"""
-        import uuid
-        lock_value = str(uuid.uuid4())
+        lock_value = secrets.token_hex(16)
         acquired = await self.redis.set(lock_key, lock_value, nx=True, ex=timeout)
         if acquired:
             return lock_value
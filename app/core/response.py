@@ -2,10 +2,37 @@
 统一API响应格式工具
 """
 from datetime import datetime
-from typing import Any, Optional, Dict
+from typing import Any, Optional, Dict, Type
+
+import orjson
+import fastapi.responses as fastapi_responses
+from fastapi.responses import JSONResponse
+
 from app.utils.timezone import now_tz
 
 
+class OrjsonResponse(JSONResponse):
+    """使用 orjson 序列化的 JSON 响应
+    orjson 无法序列化的内容（如超过 64 位的整数）回退到标准库，避免返回 500
+    """
+
+    def render(self, content: Any) -> bytes:
+        try:
+            return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+        except TypeError:
+            return super().render(content)
+
+
+def get_default_response_class() -> Type[JSONResponse]:
+    """选择应用默认响应类
+    新版 FastAPI 已通过 Pydantic 直接序列化 JSON 并弃用 ORJSONResponse，此时沿用默认 JSONResponse
+    """
+    legacy_orjson = getattr(fastapi_responses, "ORJSONResponse", None)
+    if legacy_orjson is None or getattr(legacy_orjson, "__deprecated__", None):
+        return JSONResponse
+    return OrjsonResponse
+
+
 def ok(data: Any = None, message: str = "ok") -> Dict[str, Any]:
     """标准成功响应
     返回结构：{"success": True, "data": data, "message": message, "timestamp": ...}
@@ -23,11 +23,14 @@ import time
 from datetime import datetime
 from contextlib import asynccontextmanager
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from app.core.config import settings
 from app.core.database import init_db, close_db
-from app.core.logging_config import setup_logging
+from app.core.http_client import init_http_client, close_http_client
+from app.core.response import get_default_response_class
+from app.core.logging_config import setup_logging, start_queue_logging, stop_queue_logging
 from app.routers import auth_db as auth, analysis, screening, queue, sse, health, favorites, config, reports, database, operation_logs, tags, tushare_init, akshare_init, baostock_init, historical_data, multi_period_sync, financial_data, news_data, social_media, internal_messages, usage_statistics, model_capabilities, cache, logs
 from app.routers import sync as sync_router, multi_source_sync
 from app.routers import stocks as stocks_router
@@ -219,6 +222,14 @@ async def lifespan(app: FastAPI):
     setup_logging()
     logger = logging.getLogger("app.main")
 
+    # 显式设置默认线程池（asyncio.to_thread / run_in_executor(None, ...) 共用）
+    default_executor = ThreadPoolExecutor(
+        max_workers=settings.TRADINGAGENTS_THREAD_POOL_SIZE,
+        thread_name_prefix="ta-default"
+    )
+    asyncio.get_running_loop().set_default_executor(default_executor)
+    logger.info(f"🧵 默认线程池大小: {settings.TRADINGAGENTS_THREAD_POOL_SIZE}")
+
     # 验证启动配置
     try:
         from app.core.startup_validator import validate_startup_config
@@ -229,6 +240,9 @@ async def lifespan(app: FastAPI):
 
     await init_db()
 
+    # 共享HTTP客户端（连接池复用，服务层通过 get_http_client() 获取）
+    await init_http_client()
+
     #  配置桥接：将统一配置写入环境变量，供 TradingAgents 核心库使用
     try:
         from app.core.config_bridge import bridge_config_to_env
@@ -253,6 +267,9 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logging.getLogger("webapi").warning(f"Failed to apply dynamic settings: {e}")
 
+    # 日志配置完成后切换为队列日志，文件/控制台写入移出请求路径
+    start_queue_logging()
+
     # 显示配置摘要
     await _print_config_summary(logger)
 
@@ -597,7 +614,11 @@ async def lifespan(app: FastAPI):
             logger.warning(f"UserService cleanup error: {e}")
 
         await close_db()
+        await close_http_client()
+
+        default_executor.shutdown(wait=False)
         logger.info("TradingAgents FastAPI backend stopped")
+        stop_queue_logging()
 
 
 # 创建FastAPI应用
@@ -607,6 +628,7 @@ app = FastAPI(
     version=get_version(),
     docs_url="/docs" if settings.DEBUG else None,
     redoc_url="/redoc" if settings.DEBUG else None,
+    default_response_class=get_default_response_class(),  # 旧版 FastAPI 使用 orjson 序列化响应
     lifespan=lifespan
 )
 
@@ -631,13 +653,17 @@ app.add_middleware(
 app.add_middleware(OperationLogMiddleware)
 
 
+# 不记录请求日志的路径（健康检查探针调用频繁）
+_LOG_SKIP_PATHS = frozenset({"/health", "/api/health", "/api/healthz", "/api/readyz", "/favicon.ico"})
+
+
 # 请求日志中间件
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
     start_time = time.time()
 
     # 跳过健康检查和静态文件请求的日志
-    if request.url.path in ["/health", "/favicon.ico"] or request.url.path.startswith("/static"):
+    if request.url.path in _LOG_SKIP_PATHS or request.url.path.startswith("/static"):
         response = await call_next(request)
         return response
 
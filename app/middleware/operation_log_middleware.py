@@ -32,6 +32,7 @@ class OperationLogMiddleware(BaseHTTPMiddleware):
         # 跳过记录日志的路径
         self.skip_paths = skip_paths or [
             "/health",
+            "/api/health",  # 含 /api/healthz
             "/healthz",
             "/readyz",
             "/favicon.ico",
@@ -60,7 +61,7 @@ class OperationLogMiddleware(BaseHTTPMiddleware):
             return await call_next(request)
 
         # 记录开始时间
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
 
         # 获取请求信息
         method = request.method
@@ -75,7 +76,7 @@ class OperationLogMiddleware(BaseHTTPMiddleware):
         response = await call_next(request)
 
         # 计算耗时
-        duration_ms = int((time.time() - start_time) * 1000)
+        duration_ms = (time.perf_counter_ns() - start_time) // 1_000_000
 
         # 异步记录操作日志
         if user_info:
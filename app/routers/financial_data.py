@@ -170,7 +170,7 @@ async def start_financial_sync(
         
         return ok(data={
                 "task_started": True,
-                "config": request.dict()
+                "config": request.model_dump()
             },
             message="财务数据同步任务已启动"
         )
@@ -280,7 +280,7 @@ async def _execute_financial_sync(
 ):
     """执行财务数据同步后台任务"""
     try:
-        logger.info(f"🚀 开始执行财务数据同步任务: {request.dict()}")
+        logger.info(f"🚀 开始执行财务数据同步任务: {request.model_dump()}")
         
         results = await service.sync_financial_data(
             symbols=request.symbols,
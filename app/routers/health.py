@@ -1,10 +1,16 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
 import time
+from functools import lru_cache
 from pathlib import Path
 
 router = APIRouter()
 
+# 探针响应体固定不变，预先序列化，跳过每次请求的 JSON 编码
+_HEALTHZ_BODY = b'{"status":"ok"}'
+_READYZ_BODY = b'{"ready":true}'
 
+
+@lru_cache(maxsize=1)
 def get_version() -> str:
     """从 VERSION 文件读取版本号"""
     try:
@@ -30,12 +36,12 @@ async def health():
         "message": "服务运行正常"
     }
 
-@router.get("/healthz")
+@router.get("/healthz", include_in_schema=False)
 async def healthz():
     """Kubernetes健康检查"""
-    return {"status": "ok"}
+    return Response(content=_HEALTHZ_BODY, media_type="application/json")
 
-@router.get("/readyz")
+@router.get("/readyz", include_in_schema=False)
 async def readyz():
     """Kubernetes就绪检查"""
-    return {"ready": True}
\ No newline at end of file
+    return Response(content=_READYZ_BODY, media_type="application/json")
\ No newline at end of file
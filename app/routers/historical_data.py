@@ -113,7 +113,7 @@ async def query_historical_data(request: HistoricalDataQuery):
         response_data = {
             "symbol": request.symbol,
             "count": len(results),
-            "query_params": request.dict(),
+            "query_params": request.model_dump(),
             "records": results
         }
         
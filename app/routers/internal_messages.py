@@ -83,7 +83,7 @@ async def save_internal_messages(request: InternalMessageBatchRequest):
         # 转换消息格式并添加股票代码
         messages = []
         for msg in request.messages:
-            message_dict = msg.dict()
+            message_dict = msg.model_dump()
             message_dict["symbol"] = request.symbol
             messages.append(message_dict)
         
@@ -131,7 +131,7 @@ async def query_internal_messages(request: InternalMessageQueryRequest):
         return ok(data={
                 "messages": messages,
                 "count": len(messages),
-                "params": request.dict()
+                "params": request.model_dump()
             },
             message=f"查询到 {len(messages)} 条内部消息"
         )
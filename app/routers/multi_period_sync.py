@@ -59,7 +59,7 @@ async def start_multi_period_sync(
             success=True,
             message="多周期数据同步已启动",
             data={
-                "request_params": request.dict(),
+                "request_params": request.model_dump(),
                 "start_time": datetime.utcnow().isoformat()
             }
         )
@@ -166,7 +166,7 @@ async def query_news_advanced(
         news_list = await service.query_news(params)
         
         return ok(data={
-                "query_params": request.dict(),
+                "query_params": request.model_dump(),
                 "total_count": len(news_list),
                 "news": news_list
             },
@@ -53,7 +53,7 @@ async def get_operation_logs(
         return OperationLogListResponse(
             success=True,
             data={
-                "logs": [log.dict() for log in logs],
+                "logs": [log.model_dump() for log in logs],
                 "total": total,
                 "page": page,
                 "page_size": page_size,
@@ -116,7 +116,7 @@ async def get_operation_log_detail(
         
         return {
             "success": True,
-            "data": log.dict(),
+            "data": log.model_dump(),
             "message": "获取操作日志详情成功"
         }
         
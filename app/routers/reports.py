@@ -3,6 +3,7 @@
 """
 import os
 import json
+import asyncio
 from datetime import datetime, timedelta
 from typing import List, Optional, Dict, Any
 from pathlib import Path
@@ -18,6 +19,15 @@ import logging
 
 logger = logging.getLogger("webapi")
 
+# 报告下载时每次发送的文本块大小（字符数）
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+
+def _iter_text_chunks(content: str, chunk_size: int = _DOWNLOAD_CHUNK_SIZE):
+    """按块编码并输出文本，避免一次性编码整份报告"""
+    for start in range(0, len(content), chunk_size):
+        yield content[start:start + chunk_size].encode('utf-8')
+
 # 股票名称缓存
 _stock_name_cache = {}
 
@@ -460,12 +470,9 @@ async def download_report(
             filename = f"{stock_symbol}_{analysis_date}_report.json"
             media_type = "application/json"
 
-            # 返回文件流
-            def generate():
-                yield content.encode('utf-8')
-
+            # 返回文件流（分块发送）
             return StreamingResponse(
-                generate(),
+                _iter_text_chunks(content),
                 media_type=media_type,
                 headers={"Content-Disposition": f"attachment; filename={filename}"}
             )
@@ -499,12 +506,9 @@ async def download_report(
             filename = f"{stock_symbol}_{analysis_date}_report.md"
             media_type = "text/markdown"
 
-            # 返回文件流
-            def generate():
-                yield content.encode('utf-8')
-
+            # 返回文件流（分块发送）
             return StreamingResponse(
-                generate(),
+                _iter_text_chunks(content),
                 media_type=media_type,
                 headers={"Content-Disposition": f"attachment; filename={filename}"}
             )
@@ -520,8 +524,8 @@ async def download_report(
                 )
 
             try:
-                # 生成 Word 文档
-                docx_content = report_exporter.generate_docx_report(doc)
+                # 生成 Word 文档（pandoc 转换耗时较长，放到线程中执行，避免阻塞事件循环）
+                docx_content = await asyncio.to_thread(report_exporter.generate_docx_report, doc)
                 filename = f"{stock_symbol}_{analysis_date}_report.docx"
 
                 # 返回文件流
@@ -548,8 +552,8 @@ async def download_report(
                 )
 
             try:
-                # 生成 PDF 文档
-                pdf_content = report_exporter.generate_pdf_report(doc)
+                # 生成 PDF 文档（放到线程中执行，避免阻塞事件循环）
+                pdf_content = await asyncio.to_thread(report_exporter.generate_pdf_report, doc)
                 filename = f"{stock_symbol}_{analysis_date}_report.pdf"
 
                 # 返回文件流
@@ -74,7 +74,7 @@ async def save_social_media_messages(request: SocialMediaBatchRequest):
         # 转换消息格式并添加股票代码
         messages = []
         for msg in request.messages:
-            message_dict = msg.dict()
+            message_dict = msg.model_dump()
             message_dict["symbol"] = request.symbol
             messages.append(message_dict)
 
@@ -122,7 +122,7 @@ async def query_social_media_messages(request: SocialMediaQueryRequest):
             data={
                 "messages": messages,
                 "count": len(messages),
-                "params": request.dict()
+                "params": request.model_dump()
             },
             message=f"查询到 {len(messages)} 条社媒消息"
         )
@@ -185,8 +185,8 @@ async def get_combined_stock_data(
         return {
             "success": True,
             "data": {
-                "basic_info": basic_info.dict() if basic_info else None,
-                "quotes": quotes.dict() if quotes else None,
+                "basic_info": basic_info.model_dump() if basic_info else None,
+                "quotes": quotes.model_dump() if quotes else None,
                 "symbol": symbol,
                 "timestamp": quotes.updated_at if quotes else None
             },
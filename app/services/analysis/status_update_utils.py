@@ -37,7 +37,7 @@ async def perform_update_task_status(
     elif status in [AnalysisStatus.COMPLETED, AnalysisStatus.FAILED]:
         update_data["completed_at"] = datetime.utcnow()
         if result:
-            update_data["result"] = result.dict()
+            update_data["result"] = result.model_dump()
 
     await db.analysis_tasks.update_one({"task_id": task_id}, {"$set": update_data})
 
@@ -82,7 +82,7 @@ async def perform_update_task_status_with_tracker(
     elif status in [AnalysisStatus.COMPLETED, AnalysisStatus.FAILED]:
         update_data["completed_at"] = datetime.utcnow()
         if result:
-            update_data["result"] = result.dict()
+            update_data["result"] = result.model_dump()
 
     await db.analysis_tasks.update_one({"task_id": task_id}, {"$set": update_data})
 
@@ -8,7 +8,7 @@ import uuid
 import json
 import logging
 from datetime import datetime
-from typing import Dict, Any, List, Optional, Callable
+from typing import Dict, Any, List, Optional, Callable, TYPE_CHECKING
 from pathlib import Path
 import sys
 
@@ -20,9 +20,12 @@ sys.path.insert(0, str(project_root))
 from tradingagents.utils.logging_init import init_logging
 init_logging()
 
-from tradingagents.graph.trading_graph import TradingAgentsGraph
 from tradingagents.default_config import DEFAULT_CONFIG
-from app.services.simple_analysis_service import create_analysis_config, get_provider_by_model_name
+
+if TYPE_CHECKING:
+    from tradingagents.graph.trading_graph import TradingAgentsGraph
+
+from app.services.simple_analysis_service import create_analysis_config, get_provider_by_model_name, DEFAULT_ANALYSTS
 from app.models.analysis import (
     AnalysisParameters, AnalysisResult, AnalysisTask, AnalysisBatch,
     AnalysisStatus, BatchStatus, SingleAnalysisRequest, BatchAnalysisRequest
@@ -79,15 +82,18 @@ class AnalysisService:
             logger.warning(f"⚠️ 生成新的用户ID: {new_object_id}")
             return PyObjectId(new_object_id)
     
-    def _get_trading_graph(self, config: Dict[str, Any]) -> TradingAgentsGraph:
+    def _get_trading_graph(self, config: Dict[str, Any]) -> "TradingAgentsGraph":
         """获取或创建TradingAgents图实例（带缓存）- 与单股分析保持一致"""
+        # 延迟导入：TradingAgentsGraph 依赖 LangChain 等重量级模块，避免拖慢进程启动
+        from tradingagents.graph.trading_graph import TradingAgentsGraph
+
         config_key = json.dumps(config, sort_keys=True)
 
         if config_key not in self._trading_graph_cache:
             # 直接使用完整配置，不再合并DEFAULT_CONFIG（因为create_analysis_config已经处理了）
             # 这与单股分析服务和web目录的方式一致
             self._trading_graph_cache[config_key] = TradingAgentsGraph(
-                selected_analysts=config.get("selected_analysts", ["market", "fundamentals"]),
+                selected_analysts=config.get("selected_analysts", DEFAULT_ANALYSTS),
                 debug=config.get("debug", False),
                 config=config
             )
@@ -99,9 +105,8 @@ class AnalysisService:
     def _execute_analysis_sync_with_progress(self, task: AnalysisTask, progress_tracker: RedisProgressTracker) -> AnalysisResult:
         """同步执行分析任务（在线程池中运行，带进度跟踪）"""
         try:
-            # 在线程中重新初始化日志系统
-            from tradingagents.utils.logging_init import init_logging, get_logger
-            init_logging()
+            # 日志系统为进程级配置，模块导入时已初始化，线程中无需重复初始化
+            from tradingagents.utils.logging_init import get_logger
             thread_logger = get_logger('analysis_thread')
 
             thread_logger.info(f"🔄 [线程池] 开始执行分析任务: {task.task_id} - {task.symbol}")
@@ -177,7 +182,7 @@ class AnalysisService:
             from app.services.simple_analysis_service import create_analysis_config
             config = create_analysis_config(
                 research_depth=task.parameters.research_depth,
-                selected_analysts=task.parameters.selected_analysts or ["market", "fundamentals"],
+                selected_analysts=task.parameters.selected_analysts or list(DEFAULT_ANALYSTS),
                 quick_model=quick_model,
                 deep_model=deep_model,
                 llm_provider=llm_provider,
@@ -299,7 +304,7 @@ class AnalysisService:
             from app.services.simple_analysis_service import create_analysis_config
             config = create_analysis_config(
                 research_depth=task.parameters.research_depth,
-                selected_analysts=task.parameters.selected_analysts or ["market", "fundamentals"],
+                selected_analysts=task.parameters.selected_analysts or list(DEFAULT_ANALYSTS),
                 quick_model=quick_model,
                 deep_model=deep_model,
                 llm_provider=llm_provider,
@@ -354,7 +359,7 @@ class AnalysisService:
             # 创建进度跟踪器
             progress_tracker = RedisProgressTracker(
                 task_id=task.task_id,
-                analysts=task.parameters.selected_analysts or ["market", "fundamentals"],
+                analysts=task.parameters.selected_analysts or list(DEFAULT_ANALYSTS),
                 research_depth=task.parameters.research_depth or "标准",
                 llm_provider="dashscope"
             )
@@ -574,13 +579,13 @@ class AnalysisService:
             
             # 保存到数据库
             db = get_mongo_db()
-            await db.analysis_batches.insert_one(batch.dict(by_alias=True))
-            await db.analysis_tasks.insert_many([task.dict(by_alias=True) for task in tasks])
+            await db.analysis_batches.insert_one(batch.model_dump(by_alias=True))
+            await db.analysis_tasks.insert_many([task.model_dump(by_alias=True) for task in tasks])
             
             # 提交任务到队列
             for task in tasks:
                 # 准备队列参数（直接传递分析参数，不嵌套）
-                queue_params = task.parameters.dict() if task.parameters else {}
+                queue_params = task.parameters.model_dump() if task.parameters else {}
 
                 # 添加任务元数据
                 queue_params.update({
@@ -664,7 +669,7 @@ class AnalysisService:
             # 使用标准配置函数创建完整配置
             config = create_analysis_config(
                 research_depth=task.parameters.research_depth,
-                selected_analysts=task.parameters.selected_analysts or ["market", "fundamentals"],
+                selected_analysts=task.parameters.selected_analysts or list(DEFAULT_ANALYSTS),
                 quick_model=quick_model,
                 deep_model=deep_model,
                 llm_provider=llm_provider,
@@ -879,7 +879,8 @@ class ConfigService:
         """测试大模型配置 - 真实调用API进行验证"""
         start_time = time.time()
         try:
-            import requests
+            import httpx
+            from app.core.http_client import get_http_client
 
             # 获取 provider 字符串值（兼容枚举和字符串）
             provider_str = llm_config.provider.value if hasattr(llm_config.provider, 'value') else str(llm_config.provider)
@@ -934,19 +935,19 @@ class ConfigService:
             if provider_str == "google":
                 # Google AI 使用专门的测试方法
                 logger.info(f"🔍 使用 Google AI 专用测试方法")
-                result = self._test_google_api(api_key, f"{provider_str} {llm_config.model_name}", api_base, llm_config.model_name)
+                result = await asyncio.to_thread(self._test_google_api, api_key, f"{provider_str} {llm_config.model_name}", api_base, llm_config.model_name)
                 result["response_time"] = time.time() - start_time
                 return result
             elif provider_str == "deepseek":
                 # DeepSeek 使用专门的测试方法
                 logger.info(f"🔍 使用 DeepSeek 专用测试方法")
-                result = self._test_deepseek_api(api_key, f"{provider_str} {llm_config.model_name}", llm_config.model_name)
+                result = await asyncio.to_thread(self._test_deepseek_api, api_key, f"{provider_str} {llm_config.model_name}", llm_config.model_name)
                 result["response_time"] = time.time() - start_time
                 return result
             elif provider_str == "dashscope":
                 # DashScope 使用专门的测试方法
                 logger.info(f"🔍 使用 DashScope 专用测试方法")
-                result = self._test_dashscope_api(api_key, f"{provider_str} {llm_config.model_name}", llm_config.model_name)
+                result = await asyncio.to_thread(self._test_dashscope_api, api_key, f"{provider_str} {llm_config.model_name}", llm_config.model_name)
                 result["response_time"] = time.time() - start_time
                 return result
             else:
@@ -987,8 +988,8 @@ class ConfigService:
                 logger.info(f"📦 使用模型: {llm_config.model_name}")
                 logger.info(f"📦 请求数据: {data}")
 
-                # 发送测试请求
-                response = requests.post(url, json=data, headers=headers, timeout=15)
+                # 发送测试请求（复用共享连接池，不阻塞事件循环）
+                response = await get_http_client().post(url, json=data, headers=headers, timeout=15, follow_redirects=True)
                 response_time = time.time() - start_time
 
                 logger.info(f"📡 收到响应: HTTP {response.status_code}")
@@ -1081,7 +1082,7 @@ class ConfigService:
                         "details": None
                     }
 
-        except requests.exceptions.Timeout:
+        except httpx.TimeoutException:
             response_time = time.time() - start_time
             return {
                 "success": False,
@@ -1089,7 +1090,7 @@ class ConfigService:
                 "response_time": response_time,
                 "details": None
             }
-        except requests.exceptions.ConnectionError as e:
+        except httpx.TransportError as e:
             response_time = time.time() - start_time
             return {
                 "success": False,
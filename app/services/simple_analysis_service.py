@@ -6,8 +6,12 @@
 import asyncio
 import uuid
 import logging
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple, TYPE_CHECKING
 from pathlib import Path
 import sys
 
@@ -19,8 +23,11 @@ sys.path.insert(0, str(project_root))
 from tradingagents.utils.logging_init import init_logging
 init_logging()
 
-from tradingagents.graph.trading_graph import TradingAgentsGraph
 from tradingagents.default_config import DEFAULT_CONFIG
+
+if TYPE_CHECKING:
+    from tradingagents.graph.trading_graph import TradingAgentsGraph
+
 from app.models.analysis import (
     AnalysisTask, AnalysisStatus, SingleAnalysisRequest, AnalysisParameters
 )
@@ -148,7 +155,7 @@ def get_provider_and_url_by_model_sync(model_name: str) -> dict:
                     if not api_key:
                         api_key = _get_env_api_key_for_provider(provider)
                         if api_key:
-                            logger.info(f"✅ [同步查询] 使用环境变量的 API Key")
+                            logger.debug(f"✅ [同步查询] 使用环境变量的 API Key")
                         else:
                             logger.warning(f"⚠️ [同步查询] 未找到 {provider} 的 API Key")
 
@@ -202,7 +209,7 @@ def get_provider_and_url_by_model_sync(model_name: str) -> dict:
             if not api_key:
                 api_key = _get_env_api_key_for_provider(provider)
                 if api_key:
-                    logger.info(f"✅ [同步查询] 使用环境变量的 API Key")
+                    logger.debug(f"✅ [同步查询] 使用环境变量的 API Key")
 
             client.close()
             return {
@@ -269,10 +276,30 @@ def get_provider_and_url_by_model_sync(model_name: str) -> dict:
         }
 
 
+# 未指定分析师时的默认组合（元组，避免被调用方意外修改）
+DEFAULT_ANALYSTS = ("market", "fundamentals")
+
+# 供应商 -> API Key 环境变量名
+_ENV_API_KEY_NAMES = {
+    "google": "GOOGLE_API_KEY",
+    "dashscope": "DASHSCOPE_API_KEY",
+    "openai": "OPENAI_API_KEY",
+    "deepseek": "DEEPSEEK_API_KEY",
+    "anthropic": "ANTHROPIC_API_KEY",
+    "openrouter": "OPENROUTER_API_KEY",
+    "siliconflow": "SILICONFLOW_API_KEY",
+    "qianfan": "QIANFAN_API_KEY",
+    "302ai": "AI302_API_KEY",
+}
+
+
+@lru_cache(maxsize=64)
 def _get_env_api_key_for_provider(provider: str) -> str:
     """
     从环境变量获取指定供应商的 API Key
 
+    结果按供应商缓存，配置桥接改写环境变量后会调用 cache_clear() 刷新
+
     Args:
         provider: 供应商名称，如 'google', 'dashscope' 等
 
@@ -281,19 +308,7 @@ def _get_env_api_key_for_provider(provider: str) -> str:
     """
     import os
 
-    env_key_map = {
-        "google": "GOOGLE_API_KEY",
-        "dashscope": "DASHSCOPE_API_KEY",
-        "openai": "OPENAI_API_KEY",
-        "deepseek": "DEEPSEEK_API_KEY",
-        "anthropic": "ANTHROPIC_API_KEY",
-        "openrouter": "OPENROUTER_API_KEY",
-        "siliconflow": "SILICONFLOW_API_KEY",
-        "qianfan": "QIANFAN_API_KEY",
-        "302ai": "AI302_API_KEY",
-    }
-
-    env_key_name = env_key_map.get(provider.lower())
+    env_key_name = _ENV_API_KEY_NAMES.get(provider.lower())
     if env_key_name:
         api_key = os.getenv(env_key_name)
         if api_key and api_key.strip() and api_key != "your-api-key":
@@ -302,6 +317,51 @@ def _get_env_api_key_for_provider(provider: str) -> str:
     return None
 
 
+# 供应商 -> 默认 backend_url
+_DEFAULT_BACKEND_URLS = {
+    "google": "https://generativelanguage.googleapis.com/v1beta",
+    "dashscope": "https://dashscope.aliyuncs.com/api/v1",
+    "openai": "https://api.openai.com/v1",
+    "deepseek": "https://api.deepseek.com",
+    "anthropic": "https://api.anthropic.com",
+    "openrouter": "https://openrouter.ai/api/v1",
+    "qianfan": "https://qianfan.baidubce.com/v2",
+    "302ai": "https://api.302.ai/v1",
+}
+_FALLBACK_BACKEND_URL = "https://dashscope.aliyuncs.com/compatible-mode/v1"
+
+# 模型名称到供应商的默认映射
+_DEFAULT_PROVIDER_BY_MODEL = {
+    # 阿里百炼 (DashScope)
+    'qwen-turbo': 'dashscope',
+    'qwen-plus': 'dashscope',
+    'qwen-max': 'dashscope',
+    'qwen-plus-latest': 'dashscope',
+    'qwen-max-longcontext': 'dashscope',
+
+    # OpenAI
+    'gpt-3.5-turbo': 'openai',
+    'gpt-4': 'openai',
+    'gpt-4-turbo': 'openai',
+    'gpt-4o': 'openai',
+    'gpt-4o-mini': 'openai',
+
+    # Google
+    'gemini-pro': 'google',
+    'gemini-2.0-flash': 'google',
+    'gemini-2.0-flash-thinking-exp': 'google',
+
+    # DeepSeek
+    'deepseek-chat': 'deepseek',
+    'deepseek-coder': 'deepseek',
+
+    # 智谱AI
+    'glm-4': 'zhipu',
+    'glm-3-turbo': 'zhipu',
+    'chatglm3-6b': 'zhipu'
+}
+
+
 def _get_default_backend_url(provider: str) -> str:
     """
     根据供应商名称返回默认的 backend_url
@@ -312,18 +372,7 @@ def _get_default_backend_url(provider: str) -> str:
     Returns:
         str: 默认的 backend_url
     """
-    default_urls = {
-        "google": "https://generativelanguage.googleapis.com/v1beta",
-        "dashscope": "https://dashscope.aliyuncs.com/api/v1",
-        "openai": "https://api.openai.com/v1",
-        "deepseek": "https://api.deepseek.com",
-        "anthropic": "https://api.anthropic.com",
-        "openrouter": "https://openrouter.ai/api/v1",
-        "qianfan": "https://qianfan.baidubce.com/v2",
-        "302ai": "https://api.302.ai/v1",
-    }
-
-    url = default_urls.get(provider, "https://dashscope.aliyuncs.com/compatible-mode/v1")
+    url = _DEFAULT_BACKEND_URLS.get(provider, _FALLBACK_BACKEND_URL)
     logger.info(f"🔧 [默认URL] {provider} -> {url}")
     return url
 
@@ -333,38 +382,7 @@ def _get_default_provider_by_model(model_name: str) -> str:
     根据模型名称返回默认的供应商映射
     这是一个后备方案，当数据库查询失败时使用
     """
-    # 模型名称到供应商的默认映射
-    model_provider_map = {
-        # 阿里百炼 (DashScope)
-        'qwen-turbo': 'dashscope',
-        'qwen-plus': 'dashscope',
-        'qwen-max': 'dashscope',
-        'qwen-plus-latest': 'dashscope',
-        'qwen-max-longcontext': 'dashscope',
-
-        # OpenAI
-        'gpt-3.5-turbo': 'openai',
-        'gpt-4': 'openai',
-        'gpt-4-turbo': 'openai',
-        'gpt-4o': 'openai',
-        'gpt-4o-mini': 'openai',
-
-        # Google
-        'gemini-pro': 'google',
-        'gemini-2.0-flash': 'google',
-        'gemini-2.0-flash-thinking-exp': 'google',
-
-        # DeepSeek
-        'deepseek-chat': 'deepseek',
-        'deepseek-coder': 'deepseek',
-
-        # 智谱AI
-        'glm-4': 'zhipu',
-        'glm-3-turbo': 'zhipu',
-        'chatglm3-6b': 'zhipu'
-    }
-
-    provider = model_provider_map.get(model_name, 'dashscope')  # 默认使用阿里百炼
+    provider = _DEFAULT_PROVIDER_BY_MODEL.get(model_name, 'dashscope')  # 默认使用阿里百炼
     logger.info(f"🔧 使用默认映射: {model_name} -> {provider}")
     return provider
 
@@ -588,6 +606,127 @@ def create_analysis_config(
     return config
 
 
+# 分析结果缓存的最大条目数
+RESULT_CACHE_MAX_SIZE = 512
+# 等待相同参数的分析时，同步执行方进度的间隔（秒）
+INFLIGHT_PROGRESS_POLL_INTERVAL = 2.0
+
+
+def _copy_analysis_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    """复制共享的分析结果，并分配新的 analysis_id
+    副本未实际调用模型，耗时与 Token 统计清零并标记 from_cache，避免重复计入使用统计
+    """
+    copied = dict(result)
+    copied["analysis_id"] = str(uuid.uuid4())
+    copied["execution_time"] = 0
+    copied["tokens_used"] = 0
+    copied["performance_metrics"] = {}
+    copied["from_cache"] = True
+    return copied
+
+
+def _consume_future_exception(future: asyncio.Future):
+    """读取 Future 的异常，避免无人等待时出现 "exception was never retrieved" 警告"""
+    if not future.cancelled():
+        future.exception()
+
+
+class ProviderCircuitOpenError(RuntimeError):
+    """LLM 供应商处于熔断期，消息已是面向用户的提示，无需再经 ErrorFormatter 格式化"""
+
+
+# LLM 供应商熔断状态：provider -> {"fail_count": 连续失败次数, "opened_at": 熔断（或最近一次试探）开始时间}
+_BREAKERS: Dict[str, Dict[str, Any]] = {}
+_BREAKERS_LOCK = threading.Lock()
+
+# 计入熔断的错误：大模型侧的网络、限流及其他调用错误（API Key、内容审核等配置问题不计入）
+_BREAKER_ERROR_CATEGORIES = {"llm_network", "llm_quota", "llm_other"}
+# 异常类型所属的 LLM 客户端库，用于识别消息中不含厂商名的超时/连接错误
+_BREAKER_CLIENT_MODULES = {"openai", "anthropic", "httpx", "dashscope", "google"}
+# 无法从错误信息判断来源的类别，需再结合异常类型判断
+_BREAKER_UNATTRIBUTED_CATEGORIES = {"network", "system", "unknown"}
+
+
+def _check_provider_breaker(provider: str, cooldown: float):
+    """供应商处于熔断冷却期时直接抛出异常，不再占用线程等待上游超时
+    每个冷却周期结束后只放行一次试探请求，其余请求继续拒绝，直到试探成功
+    """
+    with _BREAKERS_LOCK:
+        breaker = _BREAKERS.get(provider)
+        if breaker is None or breaker["opened_at"] is None:
+            return
+        now = time.monotonic()
+        remaining = cooldown - (now - breaker["opened_at"])
+        if remaining <= 0:
+            # 放行本次试探，并开始新的冷却周期
+            breaker["opened_at"] = now
+            logger.info(f"🔌 [熔断] LLM供应商 {provider} 冷却结束，放行一次试探请求")
+            return
+    raise ProviderCircuitOpenError(
+        f"⚠️ {provider} 暂时不可用\n\n"
+        f"该大模型供应商近期连续调用失败，已暂时熔断。\n\n"
+        f"💡 请约 {int(remaining) + 1} 秒后重试，或切换到其他大模型"
+    )
+
+
+def _record_provider_failure(provider: str, threshold: int):
+    """记录一次供应商调用失败，连续失败达到阈值时开启熔断"""
+    with _BREAKERS_LOCK:
+        breaker = _BREAKERS.setdefault(provider, {"fail_count": 0, "opened_at": None})
+        breaker["fail_count"] += 1
+        if breaker["fail_count"] >= threshold:
+            if breaker["opened_at"] is None:
+                logger.warning(f"🔌 [熔断] LLM供应商 {provider} 连续失败 {breaker['fail_count']} 次，开启熔断")
+            breaker["opened_at"] = time.monotonic()
+
+
+def _record_provider_success(provider: str):
+    """供应商调用成功，清除失败计数"""
+    with _BREAKERS_LOCK:
+        if _BREAKERS.pop(provider, None) is not None:
+            logger.info(f"🔌 [熔断] LLM供应商 {provider} 已恢复")
+
+
+def _is_llm_client_upstream_error(exc: BaseException) -> bool:
+    """判断异常是否为 LLM 客户端库报告的上游故障：超时、连接失败、5xx 或 429 限流"""
+    exc_type = type(exc)
+    if exc_type.__module__.split(".")[0] not in _BREAKER_CLIENT_MODULES:
+        return False
+    if "Timeout" in exc_type.__name__ or "Connection" in exc_type.__name__:
+        return True
+    status_code = getattr(exc, "status_code", None)
+    if status_code is None:
+        status_code = getattr(getattr(exc, "response", None), "status_code", None)
+    return isinstance(status_code, int) and (status_code >= 500 or status_code == 429)
+
+
+def _breaker_providers_for_error(error: BaseException, quick_provider: str, deep_provider: str) -> set:
+    """判断分析失败应计入哪些供应商的熔断计数
+    数据源等非大模型错误不计入；混合模式下无法确定是哪个供应商出错时也不计入
+    """
+    from app.utils.error_formatter import ErrorFormatter
+
+    category, provider = ErrorFormatter.categorize(str(error))
+    is_llm_error = category.value in _BREAKER_ERROR_CATEGORIES
+    if not is_llm_error and category.value not in _BREAKER_UNATTRIBUTED_CATEGORIES:
+        return set()
+
+    if not is_llm_error:
+        # 消息中没有厂商信息时（如 OpenAI 兼容接口的 "Error code: 503"），按异常链中的客户端异常判断
+        exc = error
+        while exc is not None and not is_llm_error:
+            is_llm_error = _is_llm_client_upstream_error(exc)
+            exc = exc.__cause__ or exc.__context__
+        if not is_llm_error:
+            return set()
+
+    if provider in (quick_provider, deep_provider):
+        return {provider}
+    if quick_provider == deep_provider:
+        return {quick_provider}
+    return set()
+
+
 class SimpleAnalysisService:
     """简化的股票分析服务类"""
 
@@ -599,13 +738,26 @@ class SimpleAnalysisService:
         self._progress_trackers: Dict[str, RedisProgressTracker] = {}
 
         # 🔧 创建共享的线程池，支持并发执行多个分析任务
-        # 默认最多同时执行3个分析任务（可根据服务器资源调整）
+        # 默认最多同时执行3个分析任务（通过 TRADINGAGENTS_API_MAX_CONCURRENCY 调整）
         import concurrent.futures
-        self._thread_pool = concurrent.futures.ThreadPoolExecutor(max_workers=3)
+        from app.core.config import settings
+        self._max_concurrency = settings.TRADINGAGENTS_API_MAX_CONCURRENCY
+        self._thread_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self._max_concurrency,
+            thread_name_prefix="ta-analysis"
+        )
+        # 超出并发上限的任务在事件循环上排队等待，而不是堆积到线程池队列中
+        self._analysis_semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        # 分析结果缓存：相同参数的重复分析在 TTL 内直接复用结果（进程内，0 表示禁用）
+        self._result_cache_ttl = settings.TRADINGAGENTS_CACHE_TTL
+        self._result_cache: "OrderedDict[Tuple, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        # 正在执行的分析（按缓存键）及其进度跟踪器，重复请求等待同一结果并同步进度
+        self._inflight_analyses: Dict[Tuple, Tuple[asyncio.Future, Optional[RedisProgressTracker]]] = {}
 
         logger.info(f"🔧 [服务初始化] SimpleAnalysisService 实例ID: {id(self)}")
         logger.info(f"🔧 [服务初始化] 内存管理器实例ID: {id(self.memory_manager)}")
-        logger.info(f"🔧 [服务初始化] 线程池最大并发数: 3")
+        logger.info(f"🔧 [服务初始化] 线程池最大并发数: {self._max_concurrency}")
 
         # 设置 WebSocket 管理器
         # 简单的股票名称缓存，减少重复查询
@@ -704,7 +856,7 @@ class SimpleAnalysisService:
             logger.warning(f"⚠️ 生成新的用户ID: {new_object_id}")
             return PyObjectId(new_object_id)
 
-    def _get_trading_graph(self, config: Dict[str, Any]) -> TradingAgentsGraph:
+    def _get_trading_graph(self, config: Dict[str, Any]) -> "TradingAgentsGraph":
         """获取或创建TradingAgents实例
 
         ⚠️ 注意：为了避免并发执行时的数据混淆，每次都创建新实例
@@ -713,12 +865,15 @@ class SimpleAnalysisService:
         TradingAgentsGraph 实例包含可变状态（self.ticker, self.curr_state等），
         如果多个线程共享同一个实例，会导致数据混淆。
         """
+        # 延迟导入：TradingAgentsGraph 依赖 LangChain 等重量级模块，避免拖慢进程启动
+        from tradingagents.graph.trading_graph import TradingAgentsGraph
+
         # 🔧 [并发安全] 每次都创建新实例，避免多线程共享状态
         # 不再使用缓存，因为 TradingAgentsGraph 有可变的实例变量
         logger.info(f"🔧 创建新的TradingAgents实例（并发安全模式）...")
 
         trading_graph = TradingAgentsGraph(
-            selected_analysts=config.get("selected_analysts", ["market", "fundamentals"]),
+            selected_analysts=config.get("selected_analysts", DEFAULT_ANALYSTS),
             debug=config.get("debug", False),
             config=config
         )
@@ -903,7 +1058,7 @@ class SimpleAnalysisService:
                 logger.info(f"📊 [线程] 创建进度跟踪器: {task_id}")
                 tracker = RedisProgressTracker(
                     task_id=task_id,
-                    analysts=request.parameters.selected_analysts or ["market", "fundamentals"],
+                    analysts=request.parameters.selected_analysts or list(DEFAULT_ANALYSTS),
                     research_depth=request.parameters.research_depth or "标准",
                     llm_provider="dashscope"
                 )
@@ -1026,15 +1181,19 @@ class SimpleAnalysisService:
                 if hasattr(request.parameters, 'deep_model'):
                     error_context['model'] = request.parameters.deep_model
 
-            # 格式化错误
-            formatted_error = ErrorFormatter.format_error(str(e), error_context)
+            if isinstance(e, ProviderCircuitOpenError):
+                # 熔断提示已是用户友好信息，保留其中的重试等待时间
+                user_friendly_error = str(e)
+            else:
+                # 格式化错误
+                formatted_error = ErrorFormatter.format_error(str(e), error_context)
 
-            # 构建用户友好的错误消息
-            user_friendly_error = (
-                f"{formatted_error['title']}\n\n"
-                f"{formatted_error['message']}\n\n"
-                f"💡 {formatted_error['suggestion']}"
-            )
+                # 构建用户友好的错误消息
+                user_friendly_error = (
+                    f"{formatted_error['title']}\n\n"
+                    f"{formatted_error['message']}\n\n"
+                    f"💡 {formatted_error['suggestion']}"
+                )
 
             # 标记进度跟踪器失败
             if progress_tracker:
@@ -1060,6 +1219,46 @@ class SimpleAnalysisService:
             # 从日志监控中注销
             unregister_analysis_tracker(task_id)
 
+    def _result_cache_key(self, request: SingleAnalysisRequest) -> Tuple:
+        """根据分析参数生成结果缓存键"""
+        params = request.parameters or AnalysisParameters()
+        analysis_date = params.analysis_date
+        if isinstance(analysis_date, datetime):
+            analysis_date = analysis_date.strftime("%Y-%m-%d")
+        elif not isinstance(analysis_date, str) or not analysis_date:
+            analysis_date = datetime.now().strftime("%Y-%m-%d")
+
+        return (
+            request.get_symbol(),
+            analysis_date,
+            tuple(sorted(params.selected_analysts or [])),
+            str(params.research_depth),
+            params.quick_analysis_model,
+            params.deep_analysis_model,
+            params.market_type,
+        )
+
+    def _get_cached_result(self, key: Tuple) -> Optional[Dict[str, Any]]:
+        """读取未过期的缓存结果，返回带新 analysis_id 的副本"""
+        entry = self._result_cache.get(key)
+        if entry is None:
+            return None
+
+        stored_at, result = entry
+        if time.monotonic() - stored_at >= self._result_cache_ttl:
+            del self._result_cache[key]
+            return None
+
+        self._result_cache.move_to_end(key)
+        return _copy_analysis_result(result)
+
+    def _store_cached_result(self, key: Tuple, result: Dict[str, Any]):
+        """写入结果缓存，超出容量时淘汰最久未使用的条目"""
+        self._result_cache[key] = (time.monotonic(), dict(result))
+        self._result_cache.move_to_end(key)
+        while len(self._result_cache) > RESULT_CACHE_MAX_SIZE:
+            self._result_cache.popitem(last=False)
+
     async def _execute_analysis_sync(
         self,
         task_id: str,
@@ -1068,21 +1267,102 @@ class SimpleAnalysisService:
         progress_tracker: Optional[RedisProgressTracker] = None
     ) -> Dict[str, Any]:
         """同步执行分析（在共享线程池中运行）"""
+        cache_key = self._result_cache_key(request)
+        if self._result_cache_ttl > 0:
+            cached = self._get_cached_result(cache_key)
+            if cached is not None:
+                logger.info(f"♻️ [结果缓存] 命中相同参数的分析结果，跳过重新分析: {task_id} - {cache_key[0]}")
+                return cached
+
+        # 相同参数的分析正在执行时，等待其结果而不是重复执行
+        inflight = self._inflight_analyses.get(cache_key)
+        if inflight is not None:
+            logger.info(f"🔗 [合并执行] 相同参数的分析正在进行，等待其结果: {task_id} - {cache_key[0]}")
+            inflight_future, leader_tracker = inflight
+            result = await self._wait_for_inflight_analysis(
+                task_id, inflight_future, leader_tracker, progress_tracker
+            )
+            return _copy_analysis_result(result)
+
         # 🔧 使用共享线程池，支持多个任务并发执行
         # 不再每次创建新的线程池，避免串行执行
         loop = asyncio.get_event_loop()
-        logger.info(f"🚀 [线程池] 提交分析任务到共享线程池: {task_id} - {request.stock_code}")
-        result = await loop.run_in_executor(
-            self._thread_pool,  # 使用共享线程池
-            self._run_analysis_sync,
-            task_id,
-            user_id,
-            request,
-            progress_tracker
-        )
+        future = loop.create_future()
+        future.add_done_callback(_consume_future_exception)
+        self._inflight_analyses[cache_key] = (future, progress_tracker)
+        try:
+            if self._analysis_semaphore.locked():
+                logger.info(f"⏳ [线程池] 并发已达上限({self._max_concurrency})，任务排队等待: {task_id}")
+            async with self._analysis_semaphore:
+                logger.info(f"🚀 [线程池] 提交分析任务到共享线程池: {task_id} - {request.stock_code}")
+                result = await loop.run_in_executor(
+                    self._thread_pool,  # 使用共享线程池
+                    self._run_analysis_sync,
+                    task_id,
+                    user_id,
+                    request,
+                    progress_tracker
+                )
+        except BaseException as e:
+            if not future.done():
+                # 取消等不属于 Exception 的中断，向等待方转换为普通异常，避免其被连带取消
+                future.set_exception(e if isinstance(e, Exception) else RuntimeError("相同参数的分析任务已中断"))
+            raise
+        else:
+            future.set_result(result)
+        finally:
+            self._inflight_analyses.pop(cache_key, None)
+
         logger.info(f"✅ [线程池] 分析任务执行完成: {task_id}")
+
+        if self._result_cache_ttl > 0:
+            self._store_cached_result(cache_key, result)
         return result
 
+    async def _wait_for_inflight_analysis(
+        self,
+        task_id: str,
+        inflight: asyncio.Future,
+        leader_tracker: Optional[RedisProgressTracker],
+        progress_tracker: Optional[RedisProgressTracker] = None
+    ) -> Dict[str, Any]:
+        """等待相同参数的分析完成，期间将执行方的进度同步到当前任务"""
+        waiting_message = "⏳ 等待相同参数的分析完成"
+        last_progress = None
+        last_message = None
+        while True:
+            progress = 20
+            message = waiting_message
+            if leader_tracker is not None:
+                leader_data = leader_tracker.progress_data
+                progress = max(progress, int(leader_data.get("progress_percentage") or 0))
+                leader_message = leader_data.get("last_message")
+                if leader_message:
+                    message = f"{waiting_message}: {leader_message}"
+
+            if progress != last_progress or message != last_message:
+                last_progress, last_message = progress, message
+                if progress_tracker:
+                    try:
+                        await asyncio.to_thread(
+                            progress_tracker.update_progress,
+                            {
+                                "progress_percentage": progress,
+                                "last_message": message
+                            }
+                        )
+                    except Exception as e:
+                        logger.warning(f"⚠️ [合并执行] 同步进度失败: {e}")
+                await self._update_progress_async(task_id, progress, message)
+
+            try:
+                # shield 保证等待超时或当前任务被取消时不会影响执行方
+                return await asyncio.wait_for(
+                    asyncio.shield(inflight), timeout=INFLIGHT_PROGRESS_POLL_INTERVAL
+                )
+            except asyncio.TimeoutError:
+                continue
+
     def _run_analysis_sync(
         self,
         task_id: str,
@@ -1092,9 +1372,8 @@ class SimpleAnalysisService:
     ) -> Dict[str, Any]:
         """同步执行分析的具体实现"""
         try:
-            # 在线程中重新初始化日志系统
-            from tradingagents.utils.logging_init import init_logging, get_logger
-            init_logging()
+            # 日志系统为进程级配置，模块导入时已初始化，线程中无需重复初始化
+            from tradingagents.utils.logging_init import get_logger
             thread_logger = get_logger('analysis_thread')
 
             thread_logger.info(f"🔄 [线程池] 开始执行分析: {task_id} - {request.stock_code}")
@@ -1235,7 +1514,7 @@ class SimpleAnalysisService:
             # 创建分析配置（支持混合模式）
             config = create_analysis_config(
                 research_depth=research_depth,
-                selected_analysts=request.parameters.selected_analysts if request.parameters else ["market", "fundamentals"],
+                selected_analysts=request.parameters.selected_analysts if request.parameters else list(DEFAULT_ANALYSTS),
                 quick_model=quick_model,
                 deep_model=deep_model,
                 llm_provider=quick_provider,  # 主要使用快速模型的供应商
@@ -1254,6 +1533,14 @@ class SimpleAnalysisService:
             logger.info(f"🔍 [模型验证] 配置中的深度模型: {config.get('deep_think_llm')}")
             logger.info(f"🔍 [模型验证] 配置中的LLM供应商: {config.get('llm_provider')}")
 
+            # 🔌 [熔断] 供应商近期连续失败时快速失败，不再等待上游超时
+            from app.core.config import settings
+            breaker_threshold = settings.TRADINGAGENTS_LLM_BREAKER_THRESHOLD
+            breaker_providers = {quick_provider, deep_provider}
+            if breaker_threshold > 0:
+                for provider in breaker_providers:
+                    _check_provider_breaker(provider, settings.TRADINGAGENTS_LLM_BREAKER_COOLDOWN)
+
             # 初始化分析引擎 - 对应步骤4 "🚀 启动引擎" (8-10%)
             update_progress_sync(9, "🚀 初始化AI分析引擎", "engine_initialization")
             trading_graph = self._get_trading_graph(config)
@@ -1303,7 +1590,7 @@ class SimpleAnalysisService:
                         return
 
                     # 分析师阶段 - 根据选择的分析师数量动态调整
-                    analysts = request.parameters.selected_analysts if request.parameters else ["market", "fundamentals"]
+                    analysts = request.parameters.selected_analysts if request.parameters else DEFAULT_ANALYSTS
 
                     # 模拟分析师执行
                     for i, analyst in enumerate(analysts):
@@ -1499,12 +1786,22 @@ class SimpleAnalysisService:
             logger.info(f"🚀 准备调用 trading_graph.propagate，progress_callback={graph_progress_callback}")
 
             # 执行实际分析，传递进度回调和task_id
-            state, decision = trading_graph.propagate(
-                request.stock_code,
-                analysis_date,
-                progress_callback=graph_progress_callback,
-                task_id=task_id
-            )
+            try:
+                state, decision = trading_graph.propagate(
+                    request.stock_code,
+                    analysis_date,
+                    progress_callback=graph_progress_callback,
+                    task_id=task_id
+                )
+            except Exception as propagate_error:
+                if breaker_threshold > 0:
+                    for provider in _breaker_providers_for_error(propagate_error, quick_provider, deep_provider):
+                        _record_provider_failure(provider, breaker_threshold)
+                raise
+
+            if breaker_threshold > 0:
+                for provider in breaker_providers:
+                    _record_provider_success(provider)
 
             logger.info(f"✅ trading_graph.propagate 执行完成")
 
@@ -1819,6 +2116,9 @@ class SimpleAnalysisService:
 
             return result
 
+        except ProviderCircuitOpenError:
+            # 熔断提示已是用户友好信息，直接抛出
+            raise
         except Exception as e:
             logger.error(f"❌ [线程池] 分析执行失败: {task_id} - {e}")
 
@@ -2618,7 +2918,9 @@ class SimpleAnalysisService:
                 "tokens_used": result.get("tokens_used", 0),
 
                 # 🆕 性能指标数据
-                "performance_metrics": result.get("performance_metrics", {})
+                "performance_metrics": result.get("performance_metrics", {}),
+                # 复用缓存/合并执行的结果（未实际调用模型）
+                "from_cache": result.get("from_cache", False)
             }
 
             # 保存到analysis_reports集合（与web目录保持一致）
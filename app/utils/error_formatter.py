@@ -79,6 +79,16 @@ class ErrorFormatter:
         # 生成友好提示
         return cls._generate_friendly_message(category, provider_or_source, error_message, context)
     
+    @classmethod
+    def categorize(cls, error_message: str, context: Optional[Dict] = None) -> Tuple[ErrorCategory, Optional[str]]:
+        """
+        仅分类错误，不生成提示文本
+
+        Returns:
+            (错误类别, 相关厂商/数据源名称)
+        """
+        return cls._categorize_error(error_message, context or {})
+
     @classmethod
     def _categorize_error(cls, error_message: str, context: Dict) -> Tuple[ErrorCategory, Optional[str]]:
         """
@@ -0,0 +1,22 @@
+import os
+
+import pytest
+
+pytest.importorskip("dotenv")
+
+from tradingagents.config import env_utils
+
+
+def test_load_dotenv_once_parses_each_file_once(tmp_path, monkeypatch):
+    env_file = tmp_path / ".env"
+    env_file.write_text("TA_TEST_ONCE=first\n", encoding="utf-8")
+    monkeypatch.delenv("TA_TEST_ONCE", raising=False)
+    monkeypatch.setattr(env_utils, "_LOADED_DOTENV_FILES", set())
+
+    assert env_utils.load_dotenv_once(env_file, override=True) is True
+    assert os.environ["TA_TEST_ONCE"] == "first"
+
+    # 同一文件再次加载时跳过解析，即使文件内容已变化
+    env_file.write_text("TA_TEST_ONCE=second\n", encoding="utf-8")
+    assert env_utils.load_dotenv_once(env_file, override=True) is False
+    assert os.environ["TA_TEST_ONCE"] == "first"
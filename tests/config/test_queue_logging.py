@@ -0,0 +1,23 @@
+import logging
+import logging.handlers
+
+
+def test_init_logging_keeps_queue_handlers(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+
+    from app.core.logging_config import setup_logging, start_queue_logging, stop_queue_logging
+    from tradingagents.utils.logging_init import init_logging
+
+    setup_logging("INFO")
+    start_queue_logging()
+    try:
+        # 分析线程中调用 init_logging 不应覆盖队列日志
+        init_logging()
+
+        root_handlers = logging.getLogger().handlers
+        assert root_handlers
+        assert all(isinstance(h, logging.handlers.QueueHandler) for h in root_handlers)
+    finally:
+        stop_queue_logging()
+
+    assert not any(isinstance(h, logging.handlers.QueueHandler) for h in logging.getLogger().handlers)
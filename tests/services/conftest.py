@@ -0,0 +1,43 @@
+import pytest
+
+
+class _FakeCollection:
+    def __init__(self):
+        self.updates = []
+
+    async def update_one(self, filter, update, *args, **kwargs):
+        self.updates.append((filter, update))
+
+
+class _FakeDB:
+    def __init__(self):
+        self.analysis_tasks = _FakeCollection()
+
+
+@pytest.fixture
+def make_analysis_service(monkeypatch):
+    """构造真实的 SimpleAnalysisService，替换配置、数据库与内存状态管理器依赖"""
+    import app.core.database as database
+    import app.services.simple_analysis_service as sas
+    from app.core.config import settings
+    from app.services.memory_state_manager import MemoryStateManager
+
+    db = _FakeDB()
+    monkeypatch.setattr(database, "get_mongo_db", lambda: db)
+    monkeypatch.setattr(sas, "get_mongo_db", lambda: db)
+
+    services = []
+
+    def factory(cache_ttl=0, max_concurrency=2):
+        monkeypatch.setattr(settings, "TRADINGAGENTS_CACHE_TTL", cache_ttl)
+        monkeypatch.setattr(settings, "TRADINGAGENTS_API_MAX_CONCURRENCY", max_concurrency)
+        # 每个服务使用独立的内存状态管理器，避免测试之间共享任务状态
+        monkeypatch.setattr(sas, "get_memory_state_manager", MemoryStateManager)
+        service = sas.SimpleAnalysisService()
+        services.append(service)
+        return service
+
+    yield factory
+
+    for service in services:
+        service._thread_pool.shutdown(wait=True)
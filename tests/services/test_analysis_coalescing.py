@@ -0,0 +1,141 @@
+import asyncio
+import threading
+
+import pytest
+
+
+def _make_request():
+    from app.models.analysis import SingleAnalysisRequest, AnalysisParameters
+
+    return SingleAnalysisRequest(symbol="000001", parameters=AnalysisParameters(analysis_date="2025-01-02"))
+
+
+def test_identical_requests_share_one_run(make_analysis_service):
+    calls = []
+
+    def run(task_id, user_id, request, progress_tracker=None):
+        calls.append(task_id)
+        threading.Event().wait(0.05)
+        return {"analysis_id": "leader", "summary": "ok", "tokens_used": 100}
+
+    async def main():
+        service = make_analysis_service()
+        # 替换实际分析执行，避免调用模型
+        service._run_analysis_sync = run
+        request = _make_request()
+        results = await asyncio.gather(*[
+            service._execute_analysis_sync(f"task-{i}", "user", request) for i in range(5)
+        ])
+        return service, results
+
+    service, results = asyncio.run(main())
+
+    assert len(calls) == 1
+    assert all(r["summary"] == "ok" for r in results)
+    assert len({r["analysis_id"] for r in results}) == 5
+    assert service._inflight_analyses == {}
+
+
+def test_leader_exception_reaches_all_waiters(make_analysis_service):
+    def run(task_id, user_id, request, progress_tracker=None):
+        threading.Event().wait(0.05)
+        raise ValueError("upstream failed")
+
+    async def main():
+        service = make_analysis_service()
+        # 替换实际分析执行，避免调用模型
+        service._run_analysis_sync = run
+        request = _make_request()
+        results = await asyncio.gather(*[
+            service._execute_analysis_sync(f"task-{i}", "user", request) for i in range(3)
+        ], return_exceptions=True)
+        return service, results
+
+    service, results = asyncio.run(main())
+
+    assert all(isinstance(r, ValueError) for r in results)
+    assert service._inflight_analyses == {}
+
+
+def test_leader_cancellation_fails_waiters_with_runtime_error(make_analysis_service):
+    release = threading.Event()
+
+    def run(task_id, user_id, request, progress_tracker=None):
+        release.wait(5)
+        return {"analysis_id": "leader"}
+
+    async def main():
+        service = make_analysis_service()
+        # 替换实际分析执行，避免调用模型
+        service._run_analysis_sync = run
+        request = _make_request()
+        leader = asyncio.create_task(service._execute_analysis_sync("leader", "user", request))
+        await asyncio.sleep(0.01)
+        waiters = [
+            asyncio.create_task(service._execute_analysis_sync(f"task-{i}", "user", request))
+            for i in range(2)
+        ]
+        await asyncio.sleep(0.01)
+
+        leader.cancel()
+        waiter_results = await asyncio.gather(*waiters, return_exceptions=True)
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        release.set()
+        return service, waiter_results
+
+    service, waiter_results = asyncio.run(main())
+
+    assert all(isinstance(r, RuntimeError) for r in waiter_results)
+    assert service._inflight_analyses == {}
+
+
+class _FakeTracker:
+    def __init__(self):
+        self.progress_data = {"progress_percentage": 0}
+        self.updates = []
+
+    def update_progress(self, progress_update):
+        self.updates.append(dict(progress_update))
+        self.progress_data.update(progress_update)
+
+
+def test_waiter_mirrors_leader_progress(monkeypatch, make_analysis_service):
+    import app.services.simple_analysis_service as sas
+
+    monkeypatch.setattr(sas, "INFLIGHT_PROGRESS_POLL_INTERVAL", 0.01)
+    started = threading.Event()
+    release = threading.Event()
+
+    def run(task_id, user_id, request, progress_tracker=None):
+        progress_tracker.update_progress({"progress_percentage": 55, "last_message": "📊 市场分析师正在分析"})
+        started.set()
+        release.wait(5)
+        return {"analysis_id": "leader"}
+
+    async def main():
+        service = make_analysis_service()
+        service._run_analysis_sync = run
+        await service.memory_manager.create_task("waiter", "user", "000001")
+        request = _make_request()
+        leader_tracker, waiter_tracker = _FakeTracker(), _FakeTracker()
+
+        leader = asyncio.create_task(service._execute_analysis_sync("leader", "user", request, leader_tracker))
+        await asyncio.to_thread(started.wait, 5)
+        waiter = asyncio.create_task(service._execute_analysis_sync("waiter", "user", request, waiter_tracker))
+        while waiter_tracker.progress_data["progress_percentage"] < 55:
+            await asyncio.sleep(0.01)
+
+        task = await service.memory_manager.get_task("waiter")
+        release.set()
+        await asyncio.gather(leader, waiter)
+        return waiter_tracker, task
+
+    waiter_tracker, task = asyncio.run(main())
+
+    assert waiter_tracker.updates[-1] == {
+        "progress_percentage": 55,
+        "last_message": "⏳ 等待相同参数的分析完成: 📊 市场分析师正在分析",
+    }
+    assert task.progress == 55
+    assert task.message.startswith("⏳ 等待相同参数的分析完成")
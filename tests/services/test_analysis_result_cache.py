@@ -0,0 +1,47 @@
+def test_cached_result_copy_resets_usage_stats(make_analysis_service):
+    service = make_analysis_service(cache_ttl=60)
+    result = {"analysis_id": "a1", "tokens_used": 1200, "execution_time": 30.5,
+              "performance_metrics": {"total": 30.5}, "summary": "ok"}
+    service._store_cached_result(("000001",), result)
+
+    cached = service._get_cached_result(("000001",))
+    assert cached["analysis_id"] != "a1"
+    assert cached["summary"] == "ok"
+    assert cached["tokens_used"] == 0
+    assert cached["execution_time"] == 0
+    assert cached["performance_metrics"] == {}
+    assert cached["from_cache"] is True
+    # 原结果不受影响
+    assert result["tokens_used"] == 1200
+
+
+def test_cached_result_expires_after_ttl(monkeypatch, make_analysis_service):
+    import app.services.simple_analysis_service as sas
+
+    now = [100.0]
+    monkeypatch.setattr(sas.time, "monotonic", lambda: now[0])
+    service = make_analysis_service(cache_ttl=60)
+    service._store_cached_result(("000001",), {"analysis_id": "a1"})
+
+    now[0] += 59
+    assert service._get_cached_result(("000001",)) is not None
+
+    now[0] += 1
+    assert service._get_cached_result(("000001",)) is None
+    assert ("000001",) not in service._result_cache
+
+
+def test_cached_result_evicts_least_recently_used(monkeypatch, make_analysis_service):
+    import app.services.simple_analysis_service as sas
+
+    monkeypatch.setattr(sas, "RESULT_CACHE_MAX_SIZE", 2)
+    service = make_analysis_service(cache_ttl=60)
+    service._store_cached_result(("a",), {"analysis_id": "a"})
+    service._store_cached_result(("b",), {"analysis_id": "b"})
+
+    # 读取 a 后，b 成为最久未使用的条目
+    assert service._get_cached_result(("a",)) is not None
+    service._store_cached_result(("c",), {"analysis_id": "c"})
+
+    assert list(service._result_cache) == [("a",), ("c",)]
+    assert service._get_cached_result(("b",)) is None
@@ -0,0 +1,83 @@
+import pytest
+
+
+def test_provider_breaker_opens_and_recovers(monkeypatch):
+    import app.services.simple_analysis_service as sas
+
+    monkeypatch.setattr(sas, "_BREAKERS", {})
+    now = [1000.0]
+    monkeypatch.setattr(sas.time, "monotonic", lambda: now[0])
+
+    # 未达到阈值前不熔断
+    sas._record_provider_failure("dashscope", threshold=2)
+    sas._check_provider_breaker("dashscope", cooldown=60)
+
+    # 达到阈值后冷却期内直接失败，其他供应商不受影响
+    sas._record_provider_failure("dashscope", threshold=2)
+    with pytest.raises(sas.ProviderCircuitOpenError, match="秒后重试"):
+        sas._check_provider_breaker("dashscope", cooldown=60)
+    sas._check_provider_breaker("deepseek", cooldown=60)
+
+    # 冷却期结束后只放行一次试探请求
+    now[0] += 61
+    sas._check_provider_breaker("dashscope", cooldown=60)
+    with pytest.raises(sas.ProviderCircuitOpenError):
+        sas._check_provider_breaker("dashscope", cooldown=60)
+
+    # 试探失败后继续熔断
+    sas._record_provider_failure("dashscope", threshold=2)
+    now[0] += 30
+    with pytest.raises(sas.ProviderCircuitOpenError):
+        sas._check_provider_breaker("dashscope", cooldown=60)
+
+    # 调用成功后清除熔断状态
+    sas._record_provider_success("dashscope")
+    sas._check_provider_breaker("dashscope", cooldown=60)
+    sas._check_provider_breaker("dashscope", cooldown=60)
+    assert "dashscope" not in sas._BREAKERS
+
+
+def test_breaker_failures_attributed_to_failing_provider():
+    import app.services.simple_analysis_service as sas
+
+    # 混合模式下按错误信息中的厂商计入
+    error = Exception("dashscope request failed: connection reset")
+    assert sas._breaker_providers_for_error(error, "dashscope", "deepseek") == {"dashscope"}
+
+    # 数据源错误不计入任何供应商
+    error = Exception("tushare connection timeout")
+    assert sas._breaker_providers_for_error(error, "dashscope", "dashscope") == set()
+
+    # 无法判断来源的普通错误不计入
+    error = ValueError("unexpected state")
+    assert sas._breaker_providers_for_error(error, "dashscope", "dashscope") == set()
+
+    # 单一供应商时，LLM 客户端库的超时错误计入该供应商；混合模式下无法确定则不计入
+    timeout_type = type("APITimeoutError", (Exception,), {"__module__": "openai._exceptions"})
+    error = timeout_type("Request timed out.")
+    assert sas._breaker_providers_for_error(error, "deepseek", "deepseek") == {"deepseek"}
+    assert sas._breaker_providers_for_error(error, "dashscope", "deepseek") == set()
+
+    # OpenAI 兼容接口的 5xx / 429 错误（消息中不含厂商名）按状态码计入
+    def _status_error(name, status_code, message):
+        error_type = type(name, (Exception,), {"__module__": "openai._exceptions"})
+        error = error_type(message)
+        error.status_code = status_code
+        return error
+
+    for error in (
+        _status_error("InternalServerError", 503, "Error code: 503 - service unavailable"),
+        _status_error("InternalServerError", 502, "Error code: 502 - bad gateway"),
+        _status_error("InternalServerError", 500, "Error code: 500 - internal server error"),
+        _status_error("RateLimitError", 429, "Error code: 429 - rate limit exceeded"),
+    ):
+        assert sas._breaker_providers_for_error(error, "siliconflow", "siliconflow") == {"siliconflow"}
+
+    # 被包装后仍能沿异常链识别
+    wrapped = RuntimeError("analysis failed")
+    wrapped.__cause__ = _status_error("InternalServerError", 503, "Error code: 503")
+    assert sas._breaker_providers_for_error(wrapped, "deepseek", "deepseek") == {"deepseek"}
+
+    # 4xx 客户端错误（非 429）不计入
+    error = _status_error("BadRequestError", 400, "Error code: 400 - invalid request")
+    assert sas._breaker_providers_for_error(error, "deepseek", "deepseek") == set()
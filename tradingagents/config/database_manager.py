@@ -35,12 +35,9 @@ class DatabaseManager:
     
     def _load_env_config(self):
         """从.env文件加载配置"""
-        # 尝试加载python-dotenv
-        try:
-            from dotenv import load_dotenv
-            load_dotenv()
-        except ImportError:
-            self.logger.info("python-dotenv未安装，直接读取环境变量")
+        # 加载.env（同一进程内只解析一次）
+        from .env_utils import load_dotenv_once
+        load_dotenv_once()
 
         # 使用强健的布尔值解析（兼容Python 3.13+）
         from .env_utils import parse_bool_env
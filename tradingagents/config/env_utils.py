@@ -5,8 +5,44 @@
 """
 
 import os
+from pathlib import Path
 from typing import Any, Union, Optional
 
+# 项目根目录下的 .env 文件
+_PROJECT_ENV_FILE = Path(__file__).resolve().parent.parent.parent / ".env"
+
+# 已加载过的 (.env 路径, override) 组合
+_LOADED_DOTENV_FILES = set()
+
+
+def load_dotenv_once(dotenv_path: Optional[Union[str, Path]] = None, override: bool = False) -> bool:
+    """
+    加载 .env 文件，同一进程内同一文件只解析一次
+
+    python-dotenv 解析较慢，而多个配置类在每次实例化时都会重新加载 .env，
+    这里记录已加载的文件，跳过重复解析。
+
+    Args:
+        dotenv_path: .env 文件路径，默认为项目根目录下的 .env
+        override: 是否覆盖已存在的环境变量
+
+    Returns:
+        bool: 本次是否实际执行了加载
+    """
+    path = Path(dotenv_path).resolve() if dotenv_path else _PROJECT_ENV_FILE
+    key = (str(path), override)
+    if key in _LOADED_DOTENV_FILES:
+        return False
+
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        return False
+
+    load_dotenv(path, override=override)
+    _LOADED_DOTENV_FILES.add(key)
+    return True
+
 
 def parse_bool_env(env_var: str, default: bool = False) -> bool:
     """
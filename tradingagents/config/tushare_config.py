@@ -6,7 +6,7 @@ Tushare配置管理
 
 import os
 from typing import Dict, Any, Optional
-from .env_utils import parse_bool_env, parse_str_env, get_env_info, validate_required_env_vars
+from .env_utils import parse_bool_env, parse_str_env, get_env_info, validate_required_env_vars, load_dotenv_once
 
 
 class TushareConfig:
@@ -18,12 +18,8 @@ class TushareConfig:
     
     def load_config(self):
         """加载Tushare配置"""
-        # 尝试加载python-dotenv
-        try:
-            from dotenv import load_dotenv
-            load_dotenv()
-        except ImportError:
-            pass
+        # 加载.env（同一进程内只解析一次）
+        load_dotenv_once()
         
         # 解析配置
         self.token = parse_str_env("TUSHARE_TOKEN", "")
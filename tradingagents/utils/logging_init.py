@@ -4,6 +4,8 @@
 在应用启动时初始化统一日志系统
 """
 
+import logging
+import logging.handlers
 import os
 import sys
 from pathlib import Path
@@ -23,6 +25,12 @@ def init_logging(config_override: Optional[dict] = None) -> None:
     Args:
         config_override: 可选的配置覆盖
     """
+    # 宿主应用已将根日志器切换为队列日志时，不再重建处理器（否则会覆盖队列并重复打开日志文件）
+    if config_override is None and any(
+        isinstance(h, logging.handlers.QueueHandler) for h in logging.getLogger().handlers
+    ):
+        return
+
     # 设置日志系统
     logger_manager = setup_logging(config_override)
     
@@ -11,7 +11,6 @@ import json
 from pathlib import Path
 import datetime
 import time
-from dotenv import load_dotenv
 
 # 添加项目根目录到Python路径
 project_root = Path(__file__).parent.parent
@@ -27,8 +26,9 @@ except ImportError:
     logging.basicConfig(level=logging.INFO)
     logger = logging.getLogger('web')
 
-# 加载环境变量
-load_dotenv(project_root / ".env", override=True)
+# 加载环境变量（同一进程内只解析一次）
+from tradingagents.config.env_utils import load_dotenv_once
+load_dotenv_once(project_root / ".env", override=True)
 
 # 导入自定义组件
 from components.sidebar import render_sidebar
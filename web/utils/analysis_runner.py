@@ -7,7 +7,6 @@ import os
 import uuid
 from pathlib import Path
 from datetime import datetime
-from dotenv import load_dotenv
 
 # 导入日志模块
 from tradingagents.utils.logging_manager import get_logger, get_logger_manager
@@ -17,8 +16,9 @@ logger = get_logger('web')
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
-# 确保环境变量正确加载
-load_dotenv(project_root / ".env", override=True)
+# 确保环境变量正确加载（web/app.py 已加载时跳过重复解析）
+from tradingagents.config.env_utils import load_dotenv_once
+load_dotenv_once(project_root / ".env", override=True)
 
 # 导入统一日志系统
 from tradingagents.utils.logging_init import setup_web_logging
@@ -36,9 +36,9 @@ class MongoDBReportManager:
     def _connect(self):
         """连接到MongoDB"""
         try:
-            # 加载环境变量
-            from dotenv import load_dotenv
-            load_dotenv()
+            # 加载环境变量（同一进程内只解析一次）
+            from tradingagents.config.env_utils import load_dotenv_once
+            load_dotenv_once()
 
             # 从环境变量获取MongoDB配置
             mongodb_host = os.getenv("MONGODB_HOST", "localhost")